@@ -5,6 +5,7 @@ It allows users to build and manipulate a Max-Min Heap through a command line in
 
 Libraries Used:
 - max_min_heap: A class for implementing the Max-Min Heap data structure
+- heap_factory: A function for selecting the heap engine (Max-Min Heap or Interval Heap)
 - tkinter: A Python library used for creating GUIs
 - textwrap: A module used for formatting text
 
@@ -23,13 +24,14 @@ Functions:
 """
 # Import libraries
 from max_min_heap import *
+from heap_factory import create_heap
 from tkinter import Tk
 from tkinter.filedialog import askopenfilename
 import textwrap
 
 class Runner:
-    def __init__(self, heap):
-        self.heap = Max_Min_Heap(heap)
+    def __init__(self, heap, engine="max_min"):
+        self.heap = create_heap(heap, engine)
         self.connected = True
         self.show_menu = True
 
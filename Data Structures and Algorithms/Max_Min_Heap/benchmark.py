@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+This script compares the heap engines available in heap_factory on the same workloads.
+
+For every engine, each operation is timed on a copy of the same random array:
+- `build`: Builds the heap from the array.
+- `insert`: Inserts new keys one at a time.
+- `extract_max`: Extracts the maximum node until half of the heap is gone.
+- `extract_min`: Extracts the minimum node until half of the heap is gone.
+- `delete`: Deletes keys at random indexes until half of the heap is gone.
+- `push_pop`: Inserts every key and immediately extracts the minimum node.
+- `sort`: Sorts the array in ascending order.
+
+Usage:
+    python benchmark.py [size] [repeat]
+"""
+# Import libraries
+import sys
+import time
+import random
+from heap_factory import HEAP_ENGINES, create_heap
+
+def built_heap(keys, engine):
+    """
+    Args:
+        keys (list): The keys of the heap.
+        engine (str): The name of the engine.
+
+    Returns:
+        A heap of the given engine, built over a copy of keys.
+    """
+    heap = create_heap(keys[:], engine)
+    heap.build_max_min_heap()
+    return heap
+
+def run_build(keys, engine):
+    """
+    Times building the heap from the keys.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = create_heap(keys[:], engine)
+    start = time.perf_counter()
+    heap.build_max_min_heap()
+    return time.perf_counter() - start
+
+def run_insert(keys, engine):
+    """
+    Times inserting the keys one at a time into an empty heap.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = create_heap([], engine)
+    start = time.perf_counter()
+    for key in keys:
+        heap.heap_insert(key)
+    return time.perf_counter() - start
+
+def run_extract_max(keys, engine):
+    """
+    Times extracting the maximum node until half of the heap is gone.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = built_heap(keys, engine)
+    start = time.perf_counter()
+    for _ in range(len(keys) // 2):
+        heap.heap_extract_max()
+    return time.perf_counter() - start
+
+def run_extract_min(keys, engine):
+    """
+    Times extracting the minimum node until half of the heap is gone.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = built_heap(keys, engine)
+    start = time.perf_counter()
+    for _ in range(len(keys) // 2):
+        heap.heap_extract_min()
+    return time.perf_counter() - start
+
+def run_delete(keys, engine):
+    """
+    Times deleting keys at random indexes until half of the heap is gone.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = built_heap(keys, engine)
+    indexes = random.Random(len(keys)).choices(range(len(keys) // 2), k=len(keys) // 2)
+    start = time.perf_counter()
+    for i in indexes:
+        heap.heap_delete(i)
+    return time.perf_counter() - start
+
+def run_push_pop(keys, engine):
+    """
+    Times inserting every key into the heap and immediately extracting the minimum node.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = built_heap(keys, engine)
+    start = time.perf_counter()
+    for key in keys:
+        heap.push_pop_min(key)
+    return time.perf_counter() - start
+
+def run_sort(keys, engine):
+    """
+    Times sorting the keys in ascending order.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    heap = create_heap(keys[:], engine)
+    start = time.perf_counter()
+    heap.heap_sort()
+    return time.perf_counter() - start
+
+WORKLOADS = {
+    "build": run_build,
+    "insert": run_insert,
+    "extract_max": run_extract_max,
+    "extract_min": run_extract_min,
+    "delete": run_delete,
+    "push_pop": run_push_pop,
+    "sort": run_sort,
+}
+
+def benchmark(size=1000, repeat=3, seed=0):
+    """
+    Times every workload on every engine and keeps the best of repeat runs.
+
+    Args:
+        size (int): The number of keys in the heap.
+        repeat (int): The number of runs per workload and engine.
+        seed (int): The seed of the random keys.
+
+    Returns:
+        dict: The best time in seconds, keyed by workload and then by engine.
+    """
+    keys = random.Random(seed).choices(range(-size, size), k=size)
+    results = {}
+    for workload, run in WORKLOADS.items():
+        results[workload] = {engine: min(run(keys, engine) for _ in range(repeat)) for engine in HEAP_ENGINES}
+    return results
+
+def print_results(results):
+    """
+    Prints the benchmark results as a table, with the time of each engine in milliseconds.
+    """
+    engines = list(HEAP_ENGINES)
+    print(f"{'workload':<12}" + "".join(f"{engine + ' (ms)':>16}" for engine in engines) + f"{'fastest':>12}")
+    for workload, times in results.items():
+        fastest = min(times, key=times.get)
+        print(f"{workload:<12}" + "".join(f"{times[engine] * 1000:>16.2f}" for engine in engines) + f"{fastest:>12}")
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print_results(benchmark(size, repeat))
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+This module selects the engine behind the heap API used by the program.
+
+Both engines provide the same operations (`build_max_min_heap()`, `heap_insert()`, `heap_extract_max()`,
+`heap_extract_min()`, `heap_delete()`, `heap_sort()`, ...), so they can be swapped per workload:
+- `max_min`: The `Max_Min_Heap` engine, the default.
+- `interval`: The `Interval_Heap` engine, often faster for double-ended workloads.
+"""
+# Import libraries
+from max_min_heap import Max_Min_Heap
+from interval_heap import Interval_Heap
+
+HEAP_ENGINES = {
+    "max_min": Max_Min_Heap,
+    "interval": Interval_Heap,
+}
+
+def create_heap(heap, engine="max_min"):
+    """
+    Creates a heap over the given array using the selected engine.
+
+    Args:
+        heap (list): An array of numbers to be converted to a heap.
+        engine (str): The name of the engine, one of the keys of HEAP_ENGINES.
+
+    Returns:
+        Max_Min_Heap or Interval_Heap: The heap, not yet built.
+    """
+    if engine not in HEAP_ENGINES:
+        raise ValueError(f"Unknown heap engine '{engine}'. Choose one of: {', '.join(HEAP_ENGINES)}")
+    return HEAP_ENGINES[engine](heap)
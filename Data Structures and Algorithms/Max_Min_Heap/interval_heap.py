@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+This module provides the implementation of an Interval Heap data structure.
+
+An Interval Heap is a complete binary tree in which every node stores a pair of keys (lo, hi) with lo <= hi,
+except possibly the last node, which may store a single key. Every node's interval contains the intervals of its
+children: the lo keys form a min-heap and the hi keys form a max-heap. The minimum key is the lo key of the root
+and the maximum key is the hi key of the root.
+
+Compared to a Max-Min Heap, no level parity is involved and every step of a sift compares a key with at most
+two children and the other key of its node, which often makes it faster for double-ended workloads.
+
+This implementation provides the `Interval_Heap` class, with the same operations as `Max_Min_Heap`:
+- `build_max_min_heap()`: Builds an interval heap from the input array A.
+- `heap_extract_max()`: Extracts the maximum node from an interval heap.
+- `heap_extract_min()`: Extracts the minimum node from an interval heap.
+- `heap_insert()`: Inserts a new node with the given key into the interval heap.
+- `push_pop_max()`: Inserts a new node and then extracts the maximum node with a single sift-down.
+- `push_pop_min()`: Inserts a new node and then extracts the minimum node with a single sift-down.
+- `replace_max()`: Extracts the maximum node and then inserts a new node with a single sift-down.
+- `replace_min()`: Extracts the minimum node and then inserts a new node with a single sift-down.
+- `heap_delete()`: Deletes the key at index i from the interval heap.
+- `heap_sort()`: Sorts an input array in ascending order.
+
+The `Interval_Heap` class is implemented using a flat list: node k stores its lo key at index 2k and its
+hi key at index 2k + 1.
+"""
+# Import library
+from helper_functions import *
+
+def lo(k):
+    """
+    Args:
+        k (int): Index of the node.
+
+    Returns:
+        int: The position of the lo key of node k.
+    """
+    return 2 * k
+
+def hi(k, n):
+    """
+    Args:
+        k (int): Index of the node.
+        n (int): The length of the heap.
+
+    Returns:
+        int: The position of the hi key of node k, which is its lo key if the node stores a single key.
+    """
+    return 2 * k + 1 if 2 * k + 1 < n else 2 * k
+
+class Interval_Heap:
+    def __init__(self, heap):
+        """
+        Constructor to initialize the interval heap with a given array.
+
+        Args:
+            A (list): An array of numbers to be converted to an interval heap.
+        """
+        self.heap = heap
+
+    def order_node(self, A, k, n):
+        """
+        Swaps the keys of node k if its lo key is greater than its hi key.
+
+        Args:
+            A (list): An array representing the interval heap.
+            k (int): Index of the node.
+            n (int): The length of the heap.
+        """
+        if A[lo(k)] > A[hi(k, n)]:
+            exchange(A, lo(k), hi(k, n))
+
+    def min_up_heapify(self, A, k):
+        """
+        Moves the lo key of node k up the min-heap of lo keys until it is in the correct position.
+
+        Args:
+            A (list): An array representing the interval heap.
+            k (int): Index of the node.
+        """
+        while k > 0 and A[lo(k)] < A[lo(parent(k))]:
+            exchange(A, lo(k), lo(parent(k)))
+            k = parent(k)
+
+    def max_up_heapify(self, A, k, n):
+        """
+        Moves the hi key of node k up the max-heap of hi keys until it is in the correct position.
+
+        Args:
+            A (list): An array representing the interval heap.
+            k (int): Index of the node.
+            n (int): The length of the heap.
+        """
+        while k > 0 and A[hi(k, n)] > A[hi(parent(k), n)]:
+            exchange(A, hi(k, n), hi(parent(k), n))
+            k = parent(k)
+
+    def min_down_heapify(self, A, k, n):
+        """
+        Moves the lo key of node k down the min-heap of lo keys until it is in the correct position.
+
+        Args:
+            A (list): An array representing the interval heap.
+            k (int): Index of the node.
+            n (int): The length of the heap.
+        """
+        while lo(leftChild(k)) < n:
+            # Find the child with the smallest lo key
+            child = leftChild(k)
+            if lo(rightChild(k)) < n and A[lo(rightChild(k))] < A[lo(child)]:
+                child = rightChild(k)
+            if A[lo(child)] >= A[lo(k)]:
+                break
+            exchange(A, lo(child), lo(k))
+            # The key moved down may be greater than the hi key of the child
+            self.order_node(A, child, n)
+            k = child
+
+    def max_down_heapify(self, A, k, n):
+        """
+        Moves the hi key of node k down the max-heap of hi keys until it is in the correct position.
+
+        Args:
+            A (list): An array representing the interval heap.
+            k (int): Index of the node.
+            n (int): The length of the heap.
+        """
+        while lo(leftChild(k)) < n:
+            # Find the child with the largest hi key
+            child = leftChild(k)
+            if lo(rightChild(k)) < n and A[hi(rightChild(k), n)] > A[hi(child, n)]:
+                child = rightChild(k)
+            if A[hi(child, n)] <= A[hi(k, n)]:
+                break
+            exchange(A, hi(child, n), hi(k, n))
+            # The key moved down may be smaller than the lo key of the child
+            self.order_node(A, child, n)
+            k = child
+
+    def build_max_min_heap(self):
+        """
+        Builds an interval heap from the input array A.
+
+        Returns:
+            None: The input array A is modified in place to form a valid interval heap.
+        """
+        n = len(self.heap)
+        nodes = (n + 1) // 2
+        # Loop over the nodes of the heap, starting from the last one and working backwards
+        for k in range(nodes - 1, -1, -1):
+            self.order_node(self.heap, k, n)
+            self.min_down_heapify(self.heap, k, n)
+            self.max_down_heapify(self.heap, k, n)
+
+    def heap_extract_max(self):
+        """
+        Extracts the maximum node from an interval heap represented as an array.
+
+        Returns:
+            The maximum node in the heap, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        # The maximum node in interval heap is the hi key of the root
+        max_idx = hi(0, len(self.heap))
+        max_node = self.heap[max_idx]
+        last_node = self.heap.pop()
+        if max_idx < len(self.heap):
+            # Move the last key to the place of the maximum and restore the interval heap property
+            self.heap[max_idx] = last_node
+            self.order_node(self.heap, 0, len(self.heap))
+            self.max_down_heapify(self.heap, 0, len(self.heap))
+        return max_node
+
+    def heap_extract_min(self):
+        """
+        Extracts the minimum node from an interval heap represented as an array.
+
+        Returns:
+            The minimum node in the heap, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        # The minimum node in interval heap is the lo key of the root
+        min_node = self.heap[0]
+        last_node = self.heap.pop()
+        if len(self.heap) > 0:
+            # Move the last key to the place of the minimum and restore the interval heap property
+            self.heap[0] = last_node
+            self.order_node(self.heap, 0, len(self.heap))
+            self.min_down_heapify(self.heap, 0, len(self.heap))
+        return min_node
+
+    def heap_insert(self, key):
+        """
+        Inserts a new node with the given key into the interval heap represented by the array A.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+        """
+        self.heap.append(key)
+        n = len(self.heap)
+        k = (n - 1) // 2
+        if n % 2 == 0:
+            # The key completes the last node, so it moves up the side of the node it belongs to
+            if self.heap[lo(k)] > self.heap[hi(k, n)]:
+                exchange(self.heap, lo(k), hi(k, n))
+                self.min_up_heapify(self.heap, k)
+            else:
+                self.max_up_heapify(self.heap, k, n)
+        elif k > 0:
+            # The key is alone in a new node, so it moves up whichever side of its parent it falls out of
+            if key < self.heap[lo(parent(k))]:
+                self.min_up_heapify(self.heap, k)
+            else:
+                self.max_up_heapify(self.heap, k, n)
+
+    def push_pop_max(self, key):
+        """
+        Inserts a new node with the given key and then extracts the maximum node, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The maximum node among the heap and the new key.
+        """
+        # If the new key is the maximum, the heap is left unchanged
+        if len(self.heap) < 1 or key >= self.heap[hi(0, len(self.heap))]:
+            return key
+        return self.replace_max(key)
+
+    def push_pop_min(self, key):
+        """
+        Inserts a new node with the given key and then extracts the minimum node, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The minimum node among the heap and the new key.
+        """
+        # If the new key is the minimum, the heap is left unchanged
+        if len(self.heap) < 1 or key <= self.heap[0]:
+            return key
+        return self.replace_min(key)
+
+    def replace_max(self, key):
+        """
+        Extracts the maximum node and then inserts a new node with the given key, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The maximum node in the heap before the replacement, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        n = len(self.heap)
+        max_node = self.heap[hi(0, n)]
+        self.heap[hi(0, n)] = key
+        self.order_node(self.heap, 0, n)
+        # If the new key fell below the lo key of the root, the previous minimum sifts down the max side
+        self.max_down_heapify(self.heap, 0, n)
+        return max_node
+
+    def replace_min(self, key):
+        """
+        Extracts the minimum node and then inserts a new node with the given key, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The minimum node in the heap before the replacement, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        n = len(self.heap)
+        min_node = self.heap[0]
+        self.heap[0] = key
+        self.order_node(self.heap, 0, n)
+        # If the new key rose above the hi key of the root, the previous maximum sifts down the min side
+        self.min_down_heapify(self.heap, 0, n)
+        return min_node
+
+    def heap_delete(self, i):
+        """
+        Deletes the key at index i from the interval heap A.
+
+        Args:
+            i (int): The index of the key to be deleted from the heap.
+        """
+        # Check if i is a valid index
+        if i >= len(self.heap):
+            return None
+        # Replace the key at index i with the last key in the heap
+        last_node = self.heap.pop()
+        n = len(self.heap)
+        if i == n:
+            return
+        self.heap[i] = last_node
+        k = i // 2
+        self.order_node(self.heap, k, n)
+        # Both keys of node k may have changed, so restore the interval heap property on both sides
+        self.min_up_heapify(self.heap, k)
+        self.min_down_heapify(self.heap, k, n)
+        self.max_up_heapify(self.heap, k, n)
+        self.max_down_heapify(self.heap, k, n)
+
+    def heap_sort(self):
+        """
+        Sorts an input array in ascending order.
+        """
+        # Build an interval heap from the input array
+        self.build_max_min_heap()
+        for n in range(len(self.heap), 1, -1):
+            # Swap the maximum node with the last key of the heap
+            exchange(self.heap, hi(0, n), n - 1)
+            # Restore the interval heap property on the remaining n - 1 keys
+            if n - 1 > 1:
+                self.order_node(self.heap, 0, n - 1)
+                self.max_down_heapify(self.heap, 0, n - 1)
+
+    def __repr__(self):
+        """
+        Return a string representation of the heap.
+        """
+        return str(self.heap)
+
+    def __len__(self):
+        """
+        Return the number of elements in the heap.
+        """
+        return len(self.heap)
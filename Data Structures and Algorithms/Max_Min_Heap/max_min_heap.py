@@ -14,6 +14,10 @@ This implementation provides the `Max_Min_Heap` class, which allows the followin
 - `heap_extract_max()`: Extracts the maximum node from a max-min heap.
 - `heap_extract_min()`: Extracts the minimum node from a max-min heap.
 - `heap_insert()`: Inserts a new node with the given key into the max-min heap.
+- `push_pop_max()`: Inserts a new node and then extracts the maximum node with a single sift-down.
+- `push_pop_min()`: Inserts a new node and then extracts the minimum node with a single sift-down.
+- `replace_max()`: Extracts the maximum node and then inserts a new node with a single sift-down.
+- `replace_min()`: Extracts the minimum node and then inserts a new node with a single sift-down.
 - `heap_delete()`: Deletes the node at index i from the max-min heap.
 - `heap_sort()`: Sorts an input array in ascending order. 
 
@@ -210,6 +214,115 @@ class Max_Min_Heap:
         # Adjust the heap by moving the new node to its correct position
         self.heap_increase_key(i, key)
     
+    def min_index(self):
+        """
+        Returns:
+            int: The index of the minimum node, which is the root in a single node heap and
+                 one of the two children of the root otherwise.
+        """
+        # Prefer the children of the root, so a smaller key never replaces the root on ties
+        if len(self.heap) < 2:
+            return 0
+        if len(self.heap) > 2 and self.heap[2] < self.heap[1]:
+            return 2
+        return 1
+
+    def push_pop_max(self, key):
+        """
+        Inserts a new node with the given key and then extracts the maximum node, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The maximum node among the heap and the new key.
+        """
+        # If the new key is the maximum, the heap is left unchanged
+        if len(self.heap) < 1 or key >= self.heap[0]:
+            return key
+        # Replace the root with the new key and restore the max-min heap property
+        max_node = self.heap[0]
+        self.heap[0] = key
+        self.max_min_heapify(self.heap, i=0, n=len(self.heap))
+        return max_node
+
+    def push_pop_min(self, key):
+        """
+        Inserts a new node with the given key and then extracts the minimum node, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The minimum node among the heap and the new key.
+        """
+        # If the new key is the minimum, the heap is left unchanged
+        if len(self.heap) < 1:
+            return key
+        min_idx = self.min_index()
+        if key <= self.heap[min_idx]:
+            return key
+        min_node = self.heap[min_idx]
+        self.replace_at_min_level(min_idx, key)
+        return min_node
+
+    def replace_max(self, key):
+        """
+        Extracts the maximum node and then inserts a new node with the given key, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The maximum node in the heap before the replacement, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        max_node = self.heap[0]
+        # If the new key is still the maximum, it simply takes the place of the root
+        self.heap[0] = key
+        if key < max_node:
+            self.max_min_heapify(self.heap, i=0, n=len(self.heap))
+        return max_node
+
+    def replace_min(self, key):
+        """
+        Extracts the minimum node and then inserts a new node with the given key, using a single sift-down.
+
+        Args:
+            key (int): The key value of the new node to be inserted into the heap.
+
+        Returns:
+            The minimum node in the heap before the replacement, or "Heap underflow" if the heap is empty.
+        """
+        # Check if array is empty
+        if len(self.heap) < 1:
+            return "Heap underflow"
+        min_idx = self.min_index()
+        min_node = self.heap[min_idx]
+        # If the new key is still the minimum, it simply takes the place of the minimum node
+        if key <= min_node:
+            self.heap[min_idx] = key
+        else:
+            self.replace_at_min_level(min_idx, key)
+        return min_node
+
+    def replace_at_min_level(self, min_idx, key):
+        """
+        Replaces the minimum node with a larger key and restores the max-min heap property.
+
+        Args:
+            min_idx (int): The index of the minimum node.
+            key (int): The new key, greater than the minimum node.
+        """
+        self.heap[min_idx] = key
+        # If the minimum node is a child of the root and the new key is greater than the root,
+        # the new key becomes the root and the previous root sifts down from the min level
+        if min_idx != 0 and self.heap[min_idx] > self.heap[0]:
+            exchange(self.heap, min_idx, 0)
+        self.max_min_heapify(self.heap, i=min_idx, n=len(self.heap))
+
     def heap_delete(self, i):
         """
         Deletes the node at index i from the max-min heap A.
@@ -228,7 +341,7 @@ class Max_Min_Heap:
             self.max_min_heapify(self.heap, i, len(self.heap))
         else:
             # Otherwise, increase the key of the node to be deleted to the value of the last element
-            self.heap_increase_key(i, A[-1])
+            self.heap_increase_key(i, self.heap[-1])
         # Remove the last element from the heap
         self.heap.pop()
     
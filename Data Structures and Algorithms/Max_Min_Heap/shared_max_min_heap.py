@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+This module provides a Max-Min Heap whose keys live in shared memory, so that several processes
+can work on the same heap without each one holding its own pickled copy of the array.
+
+The keys are stored in a `multiprocessing.shared_memory` block, preceded by a small header:
+- `version`: A seqlock-style counter. It is odd while a write is in progress and even otherwise.
+- `size`: The number of keys currently stored in the heap.
+- `capacity`: The maximum number of keys the block can hold.
+- `typecode`: The array typecode of the keys ('q' for integers, 'd' for floats).
+
+Every operation that modifies the heap is serialized through a cross-process lock and bumps the
+version counter before and after the change. The root and min-level extremes can be read without
+taking the lock: a reader retries until it sees the same even version before and after the read.
+
+This module provides the following classes:
+- `Shared_Key_Array`: A list-like view of the keys stored in the shared memory block.
+- `Shared_Max_Min_Heap`: A `Max_Min_Heap` that keeps its keys in a `Shared_Key_Array`.
+    - `attach()`: Attaches to a heap created by another process.
+    - `peek_max()`: Returns the maximum node without locking or copying the array.
+    - `peek_min()`: Returns the minimum node without locking or copying the array.
+    - `close()`: Detaches the current process from the shared memory block.
+    - `unlink()`: Frees the shared memory block once every process is done with it.
+"""
+# Import libraries
+import time
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from max_min_heap import *
+
+# Positions of the header fields, stored as unsigned 64-bit integers
+VERSION, SIZE, CAPACITY, TYPECODE = range(4)
+HEADER_BYTES = 4 * 8
+KEY_BYTES = 8
+
+class Shared_Key_Array:
+    def __init__(self, shm):
+        """
+        Constructor to create a list-like view over the keys stored in a shared memory block.
+
+        Args:
+            shm (SharedMemory): The shared memory block holding the header and the keys.
+        """
+        self.header = shm.buf[:HEADER_BYTES].cast('Q')
+        capacity = self.header[CAPACITY]
+        typecode = chr(self.header[TYPECODE])
+        self.keys = shm.buf[HEADER_BYTES:HEADER_BYTES + capacity * KEY_BYTES].cast(typecode)
+
+    def capacity(self):
+        """
+        Returns:
+            int: The maximum number of keys the shared memory block can hold.
+        """
+        return self.header[CAPACITY]
+
+    def normalize_index(self, i):
+        """
+        Converts a possibly negative index to a position in the array.
+
+        Args:
+            i (int): The index to convert.
+
+        Returns:
+            int: The position of the key in the array.
+        """
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("Shared key array index out of range")
+        return i
+
+    def __getitem__(self, i):
+        """
+        Return the key at index i, or a list of keys if i is a slice.
+        """
+        if isinstance(i, slice):
+            return self.keys[:len(self)].tolist()[i]
+        return self.keys[self.normalize_index(i)]
+
+    def __setitem__(self, i, key):
+        """
+        Replace the key at index i with the given key.
+        """
+        self.keys[self.normalize_index(i)] = key
+
+    def append(self, key):
+        """
+        Adds a key at the end of the array.
+
+        Args:
+            key (int): The key to be added.
+        """
+        n = len(self)
+        if n >= self.capacity():
+            raise IndexError("Heap overflow")
+        self.keys[n] = key
+        self.header[SIZE] = n + 1
+
+    def pop(self, i=-1):
+        """
+        Removes the key at index i from the array and returns it.
+
+        Args:
+            i (int): The index of the key to be removed, the last key by default.
+
+        Returns:
+            The removed key.
+        """
+        i = self.normalize_index(i)
+        n = len(self)
+        key = self.keys[i]
+        # Shift the keys after index i one position to the left
+        for j in range(i, n - 1):
+            self.keys[j] = self.keys[j + 1]
+        self.header[SIZE] = n - 1
+        return key
+
+    def index(self, key):
+        """
+        Returns the index of the first occurrence of the given key.
+
+        Args:
+            key (int): The key to search for.
+        """
+        return self[:].index(key)
+
+    def release(self):
+        """
+        Releases the views over the shared memory block, so the block can be closed.
+        """
+        self.keys.release()
+        self.header.release()
+
+    def __iter__(self):
+        """
+        Iterate over a snapshot of the keys in the array.
+        """
+        return iter(self[:])
+
+    def __len__(self):
+        """
+        Return the number of keys in the array.
+        """
+        return self.header[SIZE]
+
+    def __repr__(self):
+        """
+        Return a string representation of the array.
+        """
+        return str(self[:])
+
+class Shared_Max_Min_Heap(Max_Min_Heap):
+    def __init__(self, heap, capacity=None, typecode=None, lock=None):
+        """
+        Constructor to create a new shared memory block and initialize the max-min heap with a given array.
+
+        Args:
+            heap (list): An array of numbers to be converted to a max-min heap.
+            capacity (int): The maximum number of keys the heap can hold, the length of heap by default.
+            typecode (str): 'q' for integer keys or 'd' for float keys, inferred from heap by default.
+            lock (Lock): A multiprocessing lock that serializes the writers, a new lock by default.
+        """
+        if capacity is None:
+            capacity = len(heap)
+        if capacity < len(heap):
+            raise ValueError("The capacity must be at least the length of the heap")
+        if typecode is None:
+            typecode = 'q' if all(isinstance(key, int) for key in heap) else 'd'
+        if typecode not in ('q', 'd'):
+            raise ValueError("The typecode must be 'q' or 'd'")
+        self.shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + max(capacity, 1) * KEY_BYTES)
+        header = self.shm.buf[:HEADER_BYTES].cast('Q')
+        header[VERSION] = 0
+        header[SIZE] = 0
+        header[CAPACITY] = capacity
+        header[TYPECODE] = ord(typecode)
+        header.release()
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        self.writer = threading.local()
+        super().__init__(Shared_Key_Array(self.shm))
+        for key in heap:
+            self.heap.append(key)
+
+    @classmethod
+    def attach(cls, name, lock):
+        """
+        Attaches to a shared max-min heap created by another process.
+
+        Args:
+            name (str): The name of the shared memory block of the heap.
+            lock (Lock): The multiprocessing lock the heap was created with.
+
+        Returns:
+            Shared_Max_Min_Heap: A heap that shares its keys with the original one.
+        """
+        shared_heap = cls.__new__(cls)
+        shared_heap.__setstate__({"name": name, "lock": lock})
+        return shared_heap
+
+    @property
+    def name(self):
+        """
+        Returns:
+            str: The name of the shared memory block, used by other processes to attach to the heap.
+        """
+        return self.shm.name
+
+    @contextmanager
+    def writing(self):
+        """
+        Serializes a modification of the heap between processes and publishes it to the readers.
+        The version counter is odd for as long as the heap may be in an inconsistent state.
+        Nested modifications, such as heap_sort() building the heap, run inside the outer one.
+        """
+        if getattr(self.writer, "active", False):
+            yield
+            return
+        with self.lock:
+            self.writer.active = True
+            header = self.heap.header
+            header[VERSION] += 1
+            try:
+                yield
+            finally:
+                header[VERSION] += 1
+                self.writer.active = False
+
+    def read_consistent(self, read):
+        """
+        Runs a read of the heap without locking, retrying it until no write overlapped it.
+
+        Args:
+            read (function): A function reading the heap and returning the result.
+
+        Returns:
+            The result of the read.
+        """
+        header = self.heap.header
+        while True:
+            version = header[VERSION]
+            # A write is in progress, let the writer finish
+            if version % 2 == 1:
+                time.sleep(0)
+                continue
+            result = read()
+            if header[VERSION] == version:
+                return result
+
+    def peek_max(self):
+        """
+        Returns the maximum node in the heap without removing it.
+
+        Returns:
+            The maximum node in the heap, or "Heap underflow" if the heap is empty.
+        """
+        keys = self.heap.keys
+        header = self.heap.header
+
+        def read():
+            # The maximum node in max-min heap is at the root
+            if header[SIZE] < 1:
+                return "Heap underflow"
+            return keys[0]
+        return self.read_consistent(read)
+
+    def peek_min(self):
+        """
+        Returns the minimum node in the heap without removing it.
+
+        Returns:
+            The minimum node in the heap, or "Heap underflow" if the heap is empty.
+        """
+        keys = self.heap.keys
+        header = self.heap.header
+
+        def read():
+            # The minimum node in max-min heap is the root or one of its two children
+            n = header[SIZE]
+            if n < 1:
+                return "Heap underflow"
+            return min(keys[i] for i in range(min(n, 3)))
+        return self.read_consistent(read)
+
+    def build_max_min_heap(self):
+        """
+        Builds a max-min heap from the shared keys while holding the lock.
+        """
+        with self.writing():
+            super().build_max_min_heap()
+
+    def heap_extract_max(self):
+        """
+        Extracts the maximum node from the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().heap_extract_max()
+
+    def heap_extract_min(self):
+        """
+        Extracts the minimum node from the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().heap_extract_min()
+
+    def heap_insert(self, key):
+        """
+        Inserts a new node into the shared heap while holding the lock.
+        """
+        with self.writing():
+            super().heap_insert(key)
+
+    def push_pop_max(self, key):
+        """
+        Inserts a new node and then extracts the maximum node from the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().push_pop_max(key)
+
+    def push_pop_min(self, key):
+        """
+        Inserts a new node and then extracts the minimum node from the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().push_pop_min(key)
+
+    def replace_max(self, key):
+        """
+        Extracts the maximum node and then inserts a new node into the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().replace_max(key)
+
+    def replace_min(self, key):
+        """
+        Extracts the minimum node and then inserts a new node into the shared heap while holding the lock.
+        """
+        with self.writing():
+            return super().replace_min(key)
+
+    def heap_delete(self, i):
+        """
+        Deletes the node at index i from the shared heap while holding the lock.
+        """
+        with self.writing():
+            super().heap_delete(i)
+
+    def heap_sort(self):
+        """
+        Sorts the shared keys in ascending order while holding the lock.
+        """
+        with self.writing():
+            super().heap_sort()
+
+    def close(self):
+        """
+        Detaches the current process from the shared memory block of the heap.
+        """
+        self.heap.release()
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Frees the shared memory block of the heap. Should be called once, after every process closed the heap.
+        """
+        self.shm.unlink()
+
+    def __getstate__(self):
+        """
+        Pickle the heap by name, so a child process attaches to the same keys instead of copying them.
+        """
+        return {"name": self.name, "lock": self.lock}
+
+    def __setstate__(self, state):
+        """
+        Attach to the shared memory block of the heap in the child process.
+        """
+        self.shm = shared_memory.SharedMemory(name=state["name"])
+        self.lock = state["lock"]
+        self.writer = threading.local()
+        Max_Min_Heap.__init__(self, Shared_Key_Array(self.shm))